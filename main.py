@@ -1,5 +1,4 @@
-from read import read_products
-from operations import display_products, purchase_products, sell_products
+import sys
 
 def display_welcome():
     """
@@ -53,6 +52,9 @@ def main_menu():
         Enter your choice (1-4): 4
         Thank you for using WeCare System. Goodbye!
     """
+    from read import read_products
+    from operations import display_products, purchase_products, sell_products
+    
     products = read_products()
     display_welcome()
     
@@ -80,5 +82,107 @@ def main_menu():
         except ValueError:
             print("Invalid input. Please enter a number.")
 
-#Calling the main_menu funtion
-main_menu()
+def build_parser():
+    """
+    Builds the command line parser for the non-interactive subcommands.
+    
+    Returns:
+        argparse.ArgumentParser: The parser with the stock, search, sell, restock and report subcommands.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="main.py",
+                                     description="WeCare Management System. Run without a command for the interactive menu.")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    stock_parser = subparsers.add_parser("stock", help="show the stock of one product")
+    stock_parser.add_argument("product_id", type=int, help="the product ID")
+    
+    search_parser = subparsers.add_parser("search", help="find products by name, brand or origin")
+    search_parser.add_argument("text", help="the text to search for")
+    
+    sell_parser = subparsers.add_parser("sell", help="sell products from an order file")
+    sell_parser.add_argument("--from", dest="order_file", required=True,
+                             help="order file with 'product_id,quantity' lines ('-' for standard input)")
+    sell_parser.add_argument("--customer", required=True, help="the customer name")
+    sell_parser.add_argument("--phone", required=True, help="the customer's 10 digit phone number")
+    sell_parser.add_argument("--shipping", action="store_true", help="add the NPR 500 shipping cost")
+    
+    restock_parser = subparsers.add_parser("restock", help="purchase products from an order file")
+    restock_parser.add_argument("--from", dest="order_file", required=True,
+                                help="order file with 'product_id,quantity[,price]' lines ('-' for standard input)")
+    restock_parser.add_argument("--supplier", required=True, help="the supplier name")
+    
+    report_parser = subparsers.add_parser("report", help="show an inventory summary")
+    report_parser.add_argument("--low-stock", type=int, default=20,
+                               help="list products with this quantity or less (default: 20)")
+    return parser
+
+def main(argv=None):
+    """
+    Runs a single command given on the command line, or the interactive menu when there is none.
+    
+    Modules are imported only by the commands that need them, and 'stock' reads a single
+    product line instead of loading the whole inventory, so scripts start quickly.
+    
+    Parameters:
+        argv (list): The command line arguments (defaults to sys.argv[1:]).
+    
+    Returns:
+        int: The exit status (0 on success, 1 on failure).
+    
+    Example:
+        $ python main.py stock 3
+        3. Sunscreen (Aqualogica) - 199 in stock, NPR 1400.00 each
+        $ python main.py sell --from order.txt --customer "Ram Prasad" --phone 9812345678
+        [Generates and displays invoice, updates product_details.txt]
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        main_menu()
+        return 0
+    
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "stock":
+        from read import read_product
+        from money import format_money
+        details = read_product(args.product_id)
+        if details is None:
+            print("Invalid product ID: " + str(args.product_id))
+            return 1
+        print(str(args.product_id) + ". " + details["name"] + " (" + details["brand"] + ") - " + \
+              str(details["quantity"]) + " in stock, NPR " + format_money(details["cost_price"] * 2) + " each")
+        return 0
+    
+    from read import read_products, read_order_file
+    import operations
+    
+    products = read_products()
+    if args.command == "search":
+        matches = operations.search_products(products, args.text)
+        if not matches:
+            print("No products found for '" + args.text + "'.")
+            return 1
+        operations.display_products(matches)
+        return 0
+    if args.command == "report":
+        operations.report_products(products, args.low_stock)
+        return 0
+    
+    try:
+        order = read_order_file(args.order_file)
+    except (OSError, ValueError) as e:
+        print("Error reading order file: " + str(e))
+        return 1
+    if args.command == "sell":
+        done = operations.sell_from_order(products, args.customer, args.phone, order, args.shipping)
+    else:
+        done = operations.purchase_from_order(products, args.supplier, order)
+    if done:
+        return 0
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
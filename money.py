@@ -0,0 +1,78 @@
+from operator import mul
+
+def parse_money(text):
+    """
+    Converts a rupee amount to an exact number of paisa (1 NPR = 100 paisa).
+
+    The text is parsed digit by digit, so no floating point rounding is involved.
+
+    Parameters:
+        text (str or int): The amount in rupees (e.g. '200', '200.0', '349.99').
+
+    Returns:
+        int: The amount in paisa.
+
+    Raises:
+        ValueError: If the text is not a number or has a non-zero third decimal place.
+
+    Example:
+        >>> parse_money("200.0")
+        20000
+        >>> parse_money("349.99")
+        34999
+    """
+    amount = str(text).strip()
+    sign = 1
+    if amount[:1] in ("-", "+"):
+        if amount[0] == "-":
+            sign = -1
+        amount = amount[1:]
+    whole, dot, fraction = amount.partition(".")
+    if not (whole.isdecimal() or (whole == "" and fraction != "")) or \
+       not (fraction.isdecimal() or fraction == ""):
+        raise ValueError("invalid amount: '" + str(text) + "'")
+    if fraction[2:].strip("0") != "":
+        raise ValueError("amount has more than 2 decimal places: '" + str(text) + "'")
+    return sign * (int(whole or "0") * 100 + int((fraction + "00")[:2]))
+
+def format_money(paisa):
+    """
+    Formats an amount of paisa as rupees with two decimal places.
+
+    Parameters:
+        paisa (int): The amount in paisa.
+
+    Returns:
+        str: The amount in rupees.
+
+    Example:
+        >>> format_money(100000)
+        '1000.00'
+        >>> format_money(-5)
+        '-0.05'
+    """
+    sign = ""
+    if paisa < 0:
+        sign = "-"
+        paisa = -paisa
+    return sign + str(paisa // 100) + "." + str(paisa % 100).zfill(2)
+
+def total_money(quantities, prices):
+    """
+    Returns the exact total of many quantity * price pairs.
+
+    The products and the sum are worked out on plain integers inside map and sum,
+    without a Python level loop, which keeps bulk valuations and cart totals fast.
+
+    Parameters:
+        quantities (list): The quantities (int).
+        prices (list): The unit prices in paisa (int), in the same order.
+
+    Returns:
+        int: The total in paisa.
+
+    Example:
+        >>> total_money([3, 2], [40000, 140000])
+        400000
+    """
+    return sum(map(mul, quantities, prices))
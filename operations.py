@@ -2,6 +2,9 @@ from datetime import datetime
 import random
 from write import save_products, create_purchase_invoice, create_sale_invoice
 from read import pad_string
+from money import parse_money, format_money, total_money
+
+SHIPPING_COST = 50000 # Fixed shipping cost of NPR 500, in paisa
 
 def display_products(products):
     """
@@ -12,14 +15,14 @@ def display_products(products):
     
     Example:
         >>> products = {
-                 1: {'name': 'Moisturizer', 'brand': 'Nivea', 'quantity': 10, 'cost_price': 500.0, 'origin': 'Germany'}
+                 1: {'name': 'Moisturizer', 'brand': 'Nivea', 'quantity': 10, 'cost_price': 50000, 'origin': 'Germany'}
              }
         >>> display_products(products)
         Available Products:
         --------------------------------------------------------------------------------
         ID     Name                 Brand           Qty        Price (NPR)    Origin
         --------------------------------------------------------------------------------
-        1     |Vitamin C Serum      |Garnier        |10        |1000.0       |France
+        1     |Vitamin C Serum      |Garnier        |10        |1000.00      |France
         --------------------------------------------------------------------------------
     """
     print("\nAvailable Products:")
@@ -34,11 +37,75 @@ def display_products(products):
         selling_price = details["cost_price"] * 2
         display_products = pad_string(product_id, 5)+ "|" + pad_string(details["name"], 20) + "|" + \
                pad_string(details["brand"], 15)+ "|" + pad_string(details["quantity"], 10)+ "|" + \
-               pad_string(selling_price, 13)+ "|" + pad_string(details['origin'], 15) 
+               pad_string(format_money(selling_price), 13)+ "|" + pad_string(details['origin'], 15) 
         print(display_products)
         print()
     print("-" * 80)
 
+def record_purchase(products, product_id, quantity, new_cost):
+    """
+    Adds purchased stock to the inventory and updates the cost price.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        product_id (int): The ID of the purchased product.
+        quantity (int): The purchased quantity.
+        new_cost (int): The new cost price per unit in paisa.
+    
+    Returns:
+        dict: The purchase line for the invoice ('name', 'brand', 'quantity', 'cost_price').
+    
+    Example:
+        >>> record_purchase(products, 1, 5, 60000)
+        {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 5, 'cost_price': 60000}
+    """
+    products[product_id]["quantity"] += quantity
+    products[product_id]["cost_price"] = new_cost
+    return {
+        "name": products[product_id]["name"],
+        "brand": products[product_id]["brand"],
+        "quantity": quantity,
+        "cost_price": new_cost
+    }
+
+def record_sale(products, product_id, quantity):
+    """
+    Removes sold stock (including the 'buy 3 get 1 free' items) from the inventory.
+    
+    The caller is responsible for checking that enough stock is available.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        product_id (int): The ID of the sold product.
+        quantity (int): The paid quantity.
+    
+    Returns:
+        tuple: The sale line for the invoice and the free item line (None when no item is free).
+    
+    Example:
+        >>> record_sale(products, 1, 3)
+        ({'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 3, 'cost_price': 50000, 'free': 1},
+         {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 1, 'cost_price': 50000})
+    """
+    free_qty = quantity // 3
+    products[product_id]["quantity"] -= quantity + free_qty
+    sold_item = {
+        "name": products[product_id]["name"],
+        "brand": products[product_id]["brand"],
+        "quantity": quantity,
+        "cost_price": products[product_id]["cost_price"],
+        "free": free_qty
+    }
+    free_item = None
+    if free_qty > 0:
+        free_item = {
+            "name": products[product_id]["name"],
+            "brand": products[product_id]["brand"],
+            "quantity": free_qty,
+            "cost_price": products[product_id]["cost_price"]
+        }
+    return sold_item, free_item
+
 def purchase_products(products):
     """
     Handles purchasing products from a supplier, updating inventory and generating an invoice.
@@ -50,7 +117,7 @@ def purchase_products(products):
     Example:
         >>> products = {
                  1: {'name': 'Vitamin C Serum', 'brand': 'Granier',
-                 'quantity': 10, 'cost_price': 500.0, 'origin': 'France'}
+                 'quantity': 10, 'cost_price': 50000, 'origin': 'France'}
              }
         >>> purchase_products(products)
         Enter supplier name: Global Suppliers
@@ -58,7 +125,7 @@ def purchase_products(products):
         --------------------------------------------------------------------------------
         ID    Name                 Brand           Qty        Price (NPR)    Origin
         --------------------------------------------------------------------------------
-        1    |Vitamin C Serum     |Granier           |10         |1000.0       |France
+        1    |Vitamin C Serum     |Granier           |10         |1000.00      |France
         --------------------------------------------------------------------------------
         Please, Enter product ID to purchase (1 to finish): 1
         Please, Enter quantity to purchase: 5
@@ -104,10 +171,10 @@ def purchase_products(products):
         while True:
             try:
                 current_cost = products[product_id]["cost_price"]
-                new_cost = input("Current cost price is NPR " + str(current_cost) + \
+                new_cost = input("Current cost price is NPR " + format_money(current_cost) + \
                                  ". Enter new price or press enter to keep same: ")
                 if new_cost:
-                    new_cost = float(new_cost)
+                    new_cost = parse_money(new_cost)
                 else:
                     new_cost = current_cost
                 if new_cost <= 0:
@@ -117,15 +184,8 @@ def purchase_products(products):
             except ValueError:
                 print("Invalid input. Please enter a number.")
         
-        products[product_id]["quantity"] += quantity
-        products[product_id]["cost_price"] = new_cost
         #adding the purchased product and update the price of the product inventory 
-        products_purchased.append({
-            "name": products[product_id]["name"],
-            "brand": products[product_id]["brand"],
-            "quantity": quantity,
-            "cost_price": new_cost
-        })
+        products_purchased.append(record_purchase(products, product_id, quantity, new_cost))
         
         total_amount += quantity * new_cost
         print("Added " + str(quantity) + " " + products[product_id]["name"] + " to purchase list.")
@@ -156,7 +216,7 @@ def sell_products(products):
     
     Example:
         >>> products = {
-                   1: {'name': 'Moisturizer', 'brand': 'Nivea', 'quantity': 10, 'cost_price': 500.0, 'origin': 'Germany'}
+                   1: {'name': 'Moisturizer', 'brand': 'Nivea', 'quantity': 10, 'cost_price': 50000, 'origin': 'Germany'}
                  }
         >>> sell_products(products)
         Please, Enter customer name: Ram bahudur
@@ -165,7 +225,7 @@ def sell_products(products):
         --------------------------------------------------------------------------------
         ID    Name                 Brand           Qty        Price (NPR)    Origin
         --------------------------------------------------------------------------------
-        1     Moisturizer         Nivea           10         1000.0         Germany
+        1     Moisturizer         Nivea           10         1000.00        Germany
         --------------------------------------------------------------------------------
         Enter product ID to sell (1 to finish): 1
         Enter quantity to sell (max 10): 3
@@ -240,24 +300,13 @@ def sell_products(products):
                 print("Invalid input. Please enter a number.")
         
         # Process the sale
-        products[product_id]["quantity"] -= total_quantity_to_deduct
+        sold_item, free_item = record_sale(products, product_id, quantity)
         selling_price = products[product_id]['cost_price'] * 2
         #this will add the sold product into the sell product list
-        products_sold.append({
-            "name": products[product_id]["name"],
-            "brand": products[product_id]["brand"],
-            "quantity": quantity,
-            "cost_price": products[product_id]["cost_price"],
-            "free": free_qty
-        })
+        products_sold.append(sold_item)
         
-        if free_qty > 0:
-            free_items.append({
-                "name": products[product_id]["name"],
-                "brand": products[product_id]["brand"],
-                "quantity": free_qty,
-                "cost_price": products[product_id]["cost_price"]
-            })
+        if free_item:
+            free_items.append(free_item)
             print("Dear " + customer_name + ", you get " + str(free_qty) + \
                   " free items with this purchase!")
             
@@ -285,7 +334,7 @@ def sell_products(products):
         shipping = input("Do you need shipping? (yes/no): ").lower()
         if shipping in ['yes', 'y', 'no', 'n']:
             if shipping in ['yes', 'y']:
-                shipping_cost = 500 #Fixed shipping cost is 500
+                shipping_cost = SHIPPING_COST
                 print("Shipping cost: NPR 500 will be added to your total.")
             break
         print("Invalid input. Please enter 'yes' or 'no'.")
@@ -296,3 +345,186 @@ def sell_products(products):
         create_sale_invoice(products_sold, customer_name, phone_number, total_amount, free_items, shipping_cost)
     else:
         print("No products sold.")
+
+def search_products(products, text):
+    """
+    Finds the products whose name, brand or origin contains the given text.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        text (str): The text to search for (case-insensitive).
+    
+    Returns:
+        dict: The matching products, keeping their original IDs.
+    
+    Example:
+        >>> search_products(products, "serum")
+        {1: {'name': 'Vitamin C Serum', ...}, 14: {'name': 'Serum', ...}}
+    """
+    text = text.lower()
+    matches = {}
+    for product_id, details in products.items():
+        if text in details["name"].lower() or text in details["brand"].lower() or \
+           text in details["origin"].lower():
+            matches[product_id] = details
+    return matches
+
+def report_products(products, low_stock=20):
+    """
+    Displays an inventory summary with stock valuation and low stock products.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        low_stock (int): Products with a quantity at or below this value are listed as low stock.
+    
+    Example:
+        >>> report_products(products)
+        Inventory Report:
+        --------------------------------------------------------------------------------
+        Products: 14
+        Units in stock: 2145
+        Stock value at cost: NPR 896050.00
+        Stock value at selling price: NPR 1792100.00
+        --------------------------------------------------------------------------------
+        Low stock (20 or less): None
+        --------------------------------------------------------------------------------
+    """
+    quantities = [details["quantity"] for details in products.values()]
+    total_units = sum(quantities)
+    cost_value = total_money(quantities, [details["cost_price"] for details in products.values()])
+    low_stock_products = []
+    for product_id, details in products.items():
+        if details["quantity"] <= low_stock:
+            low_stock_products.append(str(product_id) + ". " + details["name"] + \
+                                      " (" + str(details["quantity"]) + " left)")
+    
+    print("\nInventory Report:")
+    print("-" * 80)
+    print("Products: " + str(len(products)))
+    print("Units in stock: " + str(total_units))
+    print("Stock value at cost: NPR " + format_money(cost_value))
+    print("Stock value at selling price: NPR " + format_money(cost_value * 2))
+    print("-" * 80)
+    if low_stock_products:
+        print("Low stock (" + str(low_stock) + " or less):")
+        for line in low_stock_products:
+            print("  " + line)
+    else:
+        print("Low stock (" + str(low_stock) + " or less): None")
+    print("-" * 80)
+
+def purchase_from_order(products, supplier_name, order):
+    """
+    Restocks products from a prepared order without prompting, then saves and invoices it.
+    
+    The whole order is validated first, so nothing is saved if any line is invalid.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        supplier_name (str): The name of the supplier.
+        order (list): A list of (product_id, quantity, cost_price) tuples (see read_order_file).
+            A cost_price of None keeps the current cost price.
+    
+    Returns:
+        bool: True if the purchase was recorded, False if the order was rejected.
+    
+    Example:
+        >>> purchase_from_order(products, "Global Suppliers", [(1, 5, None), (3, 2, 65000)])
+        [Generates and displays invoice, updates products dictionary and file]
+        True
+    """
+    if supplier_name == "":
+        print("Error: Supplier name must not be empty.")
+        return False
+    if not order:
+        print("No products purchased.")
+        return False
+    for product_id, quantity, cost_price in order:
+        if product_id not in products:
+            print("Error: Invalid product ID " + str(product_id) + ".")
+            return False
+        if quantity <= 0:
+            print("Error: Quantity must be positive for product ID " + str(product_id) + ".")
+            return False
+        if cost_price is not None and cost_price <= 0:
+            print("Error: Price must be positive for product ID " + str(product_id) + ".")
+            return False
+    
+    products_purchased = []
+    for product_id, quantity, cost_price in order:
+        if cost_price is None:
+            cost_price = products[product_id]["cost_price"]
+        products_purchased.append(record_purchase(products, product_id, quantity, cost_price))
+    total_amount = total_money([item["quantity"] for item in products_purchased],
+                               [item["cost_price"] for item in products_purchased])
+    
+    save_products(products)
+    create_purchase_invoice(products_purchased, supplier_name, total_amount)
+    return True
+
+def sell_from_order(products, customer_name, phone_number, order, shipping=False):
+    """
+    Sells products from a prepared order without prompting, then saves and invoices it.
+    
+    The 'buy 3 get 1 free' offer is applied to every line, and the whole order is
+    validated against the available stock first, so nothing is saved if any line is invalid.
+    
+    Parameters:
+        products (dict): A dictionary of products with IDs as keys and details as values (see read_products).
+        customer_name (str): The name of the customer.
+        phone_number (str): The customer's 10 digit phone number.
+        order (list): A list of (product_id, quantity, cost_price) tuples (see read_order_file).
+            The cost_price is ignored for sales.
+        shipping (bool): Whether to add the fixed NPR 500 shipping cost.
+    
+    Returns:
+        bool: True if the sale was recorded, False if the order was rejected.
+    
+    Example:
+        >>> sell_from_order(products, "Ram Prasad", "9812345678", [(1, 3, None)], shipping=True)
+        [Generates and displays invoice, updates products dictionary and file]
+        True
+    """
+    if customer_name == "" or phone_number == "":
+        print("Error: Customer name and phone number must not be empty.")
+        return False
+    if not phone_number.isdigit() or len(phone_number) != 10:
+        print("Error: Phone number must be 10 digits.")
+        return False
+    if not order:
+        print("No products sold.")
+        return False
+    
+    remaining = {}
+    for product_id, quantity, cost_price in order:
+        if product_id not in products:
+            print("Error: Invalid product ID " + str(product_id) + ".")
+            return False
+        if quantity <= 0:
+            print("Error: Quantity must be positive for product ID " + str(product_id) + ".")
+            return False
+        available = remaining.get(product_id, products[product_id]["quantity"])
+        free_qty = quantity // 3
+        if quantity + free_qty > available:
+            print("Error: Only " + str(available) + " of product ID " + str(product_id) + \
+                  " available. Cannot sell the " + str(quantity) + " quantity with " + \
+                  str(free_qty) + " free.")
+            return False
+        remaining[product_id] = available - quantity - free_qty
+    
+    products_sold = []
+    free_items = []
+    for product_id, quantity, cost_price in order:
+        sold_item, free_item = record_sale(products, product_id, quantity)
+        products_sold.append(sold_item)
+        if free_item:
+            free_items.append(free_item)
+    total_amount = total_money([item["quantity"] for item in products_sold],
+                               [item["cost_price"] * 2 for item in products_sold])
+    
+    shipping_cost = 0
+    if shipping:
+        shipping_cost = SHIPPING_COST
+    save_products(products)
+    create_sale_invoice(products_sold, customer_name, phone_number, total_amount, free_items, shipping_cost)
+    return True
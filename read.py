@@ -1,30 +1,34 @@
-def read_products():
+from money import parse_money
+
+def read_products(filename="product_details.txt"):
     """
     Reads product details from a file and returns a dictionary of products.
     
+    Parameters:
+        filename (str): The product file to read (defaults to 'product_details.txt').
    
     Returns:
         dict: A dictionary with product IDs as keys and details as values. Each product entry includes:
             - 'name' (str): The name of the product.
             - 'brand' (str): The brand of the product.
             - 'quantity' (int): The quantity available.
-            - 'cost_price' (float): The cost price of the product.
+            - 'cost_price' (int): The cost price of the product in paisa (see money.parse_money).
             - 'origin' (str): The country of origin.
     
     Raises:
-        FileNotFoundError: If 'product_details.txt' is not found.
+        FileNotFoundError: If the product file is not found.
         ValueError: If the file contains invalid data (e.g., non-numeric quantity or price).
     
     Example:
         >>> read_products()
         {
-            1: {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 10, 'cost_price': 500.0, 'origin': 'France'},
-            2: {'name': 'Sunscreen', 'brand': 'Lakme', 'quantity': 20, 'cost_price': 300.0, 'origin': 'India'}
+            1: {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 10, 'cost_price': 50000, 'origin': 'France'},
+            2: {'name': 'Sunscreen', 'brand': 'Lakme', 'quantity': 20, 'cost_price': 30000, 'origin': 'India'}
         }
     """
     products = {}
     try:
-        with open("product_details.txt", "r") as file:
+        with open(filename, "r") as file:
             lines = file.readlines()
             product_id = 1
             for line in lines:
@@ -34,7 +38,7 @@ def read_products():
                         "name": line[0],
                         "brand": line[1],
                         "quantity": int(line[2]),
-                        "cost_price": float(line[3]),
+                        "cost_price": parse_money(line[3]),
                         "origin": line[4]
                     }   
                     product_id += 1
@@ -44,6 +48,99 @@ def read_products():
         print("Error reading product file: " + str(e))
     return products
 
+def read_product(product_id):
+    """
+    Reads the details of a single product without loading the whole inventory.
+
+    Product IDs are assigned in the same way as read_products (one per valid line,
+    starting from 1), so the file is only scanned up to the requested line.
+
+    Parameters:
+        product_id (int): The ID of the product to look up.
+
+    Returns:
+        dict or None: The product details (see read_products), or None if the ID
+        does not exist or the file cannot be read.
+
+    Example:
+        >>> read_product(1)
+        {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 10, 'cost_price': 50000, 'origin': 'France'}
+        >>> read_product(999)
+        None
+    """
+    if product_id < 1:
+        return None
+    try:
+        with open("product_details.txt", "r") as file:
+            current_id = 1
+            for line in file:
+                line = line.replace("\n","").split(",")
+                if len(line) >= 5:
+                    if current_id == product_id:
+                        return {
+                            "name": line[0],
+                            "brand": line[1],
+                            "quantity": int(line[2]),
+                            "cost_price": parse_money(line[3]),
+                            "origin": line[4]
+                        }
+                    current_id += 1
+    except FileNotFoundError:
+        print("Error: Product file not found.")
+    except Exception as e:
+        print("Error reading product file: " + str(e))
+    return None
+
+def read_order_file(filename):
+    """
+    Reads a restock or sale order from a file (or standard input when filename is '-').
+
+    Each non-empty line holds 'product_id,quantity' with an optional third field
+    for the new cost price (used by restocks). Lines starting with '#' are ignored.
+
+    Parameters:
+        filename (str): The path of the order file, or '-' for standard input.
+
+    Returns:
+        list: A list of (product_id, quantity, cost_price) tuples, where cost_price
+        is in paisa, or None when the line has no price.
+
+    Raises:
+        FileNotFoundError: If the order file is not found.
+        ValueError: If a line is malformed or contains non-numeric values.
+
+    Example:
+        >>> read_order_file("order.txt")   # order.txt contains "1,5" and "3,2,650"
+        [(1, 5, None), (3, 2, 65000)]
+    """
+    if filename == "-":
+        import sys
+        lines = sys.stdin.readlines()
+    else:
+        with open(filename, "r") as file:
+            lines = file.readlines()
+
+    order = []
+    line_number = 0
+    for line in lines:
+        line_number += 1
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        fields = line.split(",")
+        if len(fields) not in (2, 3):
+            raise ValueError("line " + str(line_number) + ": expected 'product_id,quantity[,price]'")
+        try:
+            product_id = int(fields[0])
+            quantity = int(fields[1])
+            cost_price = None
+            if len(fields) == 3 and fields[2].strip() != "":
+                cost_price = parse_money(fields[2])
+        except ValueError:
+            raise ValueError("line " + str(line_number) + ": non-numeric value in '" + line + "'")
+        order.append((product_id, quantity, cost_price))
+    return order
+
 def pad_string(text, length):
     """
     Pads a string with spaces to a specified length.
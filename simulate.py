@@ -0,0 +1,490 @@
+import json
+import os
+import random
+import re
+import selectors
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+MENU_PROMPT = "\nEnter your choice (1-4): "
+OPERATIONS = {"1": "display", "2": "restock", "3": "sell", "4": "exit"}
+
+# prompts are not followed by a new line, so these messages may share a line with one
+ADDED_LINE = re.compile(r"Added (\d+) (.+) to purchase list\.$", re.MULTILINE)
+SOLD_LINE = re.compile(r"Sold (\d+) (.+) with (\d+) free\.$", re.MULTILINE)
+INVOICE_LINE = re.compile(r"invoice saved to: (\S+)")
+
+def load_products(data_dir):
+    """
+    Reads the products of a data directory (see read_products).
+
+    Parameters:
+        data_dir (str): The directory containing product_details.txt.
+
+    Returns:
+        dict: A dictionary with product IDs as keys and details as values.
+    """
+    from read import read_products
+
+    return read_products(os.path.join(data_dir, "product_details.txt"))
+
+def record_session(script_file):
+    """
+    Runs the interactive menu and records every answer as a replayable session script.
+
+    Each main menu choice starts a new operation. The script is saved as one JSON
+    object per line with the operation name and the inputs typed for it (the menu
+    choice included). The final exit is not recorded, replays add it themselves.
+
+    Parameters:
+        script_file (str): The file to save the session script to.
+
+    Example:
+        $ python simulate.py record cashier.jsonl
+        [Runs the normal menu, then saves cashier.jsonl]
+        {"op": "sell", "inputs": ["3", "Ram Prasad", "9812345678", "1", "3", "no", "no"]}
+    """
+    import builtins
+    from main import main_menu
+
+    session = []
+    original_input = builtins.input
+
+    def recording_input(prompt=""):
+        answer = original_input(prompt)
+        if prompt == MENU_PROMPT:
+            session.append({"op": OPERATIONS.get(answer.strip(), "invalid"), "inputs": []})
+        if session:
+            session[-1]["inputs"].append(answer)
+        return answer
+
+    builtins.input = recording_input
+    try:
+        main_menu()
+    finally:
+        builtins.input = original_input
+        save_session(script_file, [operation for operation in session if operation["op"] != "exit"])
+        print("Session recorded to: " + script_file)
+
+def save_session(script_file, session):
+    """
+    Saves a session script as one JSON operation per line.
+
+    Parameters:
+        script_file (str): The file to save the session script to.
+        session (list): A list of operations ({'op': str, 'inputs': list of str}).
+    """
+    with open(script_file, "w") as file:
+        for operation in session:
+            file.write(json.dumps(operation) + "\n")
+
+def load_session(script_file):
+    """
+    Loads a session script saved by record_session or generate_session.
+
+    Parameters:
+        script_file (str): The session script file.
+
+    Returns:
+        list: A list of operations ({'op': str, 'inputs': list of str}).
+
+    Raises:
+        ValueError: If a line is not a valid JSON operation.
+    """
+    session = []
+    with open(script_file, "r") as file:
+        for line in file:
+            if line.strip():
+                session.append(json.loads(line))
+    return session
+
+def generate_session(products, operations_count, rng):
+    """
+    Generates a synthetic cashier session of display, restock and sell operations.
+
+    The stock is tracked while generating, so every cart is valid for the given
+    products (including the 'buy 3 get 1 free' items) and the inputs never hit a
+    validation prompt when replayed against the same data.
+
+    Parameters:
+        products (dict): The starting products (see read_products).
+        operations_count (int): The number of menu operations to generate.
+        rng (random.Random): The random number generator to use.
+
+    Returns:
+        list: A list of operations ({'op': str, 'inputs': list of str}).
+
+    Example:
+        >>> generate_session(products, 2, random.Random(1))
+        [{'op': 'display', 'inputs': ['1']},
+         {'op': 'sell', 'inputs': ['3', 'Customer 98', '9800000098', '5', '2', 'no', 'no']}]
+    """
+    stock = {}
+    for product_id, details in products.items():
+        stock[product_id] = details["quantity"]
+    product_ids = list(stock)
+    session = []
+
+    for count in range(operations_count):
+        choice = rng.random()
+        sellable = [product_id for product_id in product_ids if stock[product_id] > 0]
+        if not product_ids:
+            operation = "display"
+        elif choice < 0.2:
+            operation = "display"
+        elif choice < 0.4 or not sellable:
+            operation = "restock"
+        else:
+            operation = "sell"
+
+        if operation == "display":
+            session.append({"op": "display", "inputs": ["1"]})
+
+        elif operation == "restock":
+            inputs = ["2", "Supplier " + str(rng.randint(1, 50))]
+            items = rng.randint(1, 3)
+            for item in range(items):
+                product_id = rng.choice(product_ids)
+                quantity = rng.randint(1, 50)
+                new_price = ""
+                if rng.random() < 0.2:
+                    new_price = str(rng.randint(100, 1000))
+                stock[product_id] += quantity
+                inputs += [str(product_id), str(quantity), new_price]
+                if item < items - 1:
+                    inputs.append("yes")
+            inputs.append("no")
+            session.append({"op": "restock", "inputs": inputs})
+
+        else:
+            customer = rng.randint(1, 99)
+            inputs = ["3", "Customer " + str(customer), "98" + str(customer).zfill(8)]
+            cart = []
+            for item in range(rng.randint(1, 4)):
+                sellable = [product_id for product_id in product_ids if stock[product_id] > 0]
+                if not sellable:
+                    break
+                product_id = rng.choice(sellable)
+                # largest quantity whose free items still fit in the stock
+                max_quantity = (stock[product_id] * 3 + 2) // 4
+                quantity = rng.randint(1, min(10, max_quantity))
+                stock[product_id] -= quantity + quantity // 3
+                cart.append([str(product_id), str(quantity)])
+            for index in range(len(cart)):
+                inputs += cart[index]
+                if index < len(cart) - 1:
+                    inputs.append("yes")
+                else:
+                    inputs.append("no")
+            inputs.append(rng.choice(["yes", "no"]))
+            session.append({"op": "sell", "inputs": inputs})
+    return session
+
+def read_until(process, selector, buffer, position, marker, timeout):
+    """
+    Reads the output of a process until the marker appears after the given position.
+
+    Parameters:
+        process (subprocess.Popen): The running process.
+        selector (selectors.BaseSelector): A selector with the process output registered.
+        buffer (bytearray): All output read so far; new output is appended to it.
+        position (int): The buffer position to search the marker from.
+        marker (bytes): The output that ends the wait.
+        timeout (float): The maximum number of seconds to wait.
+
+    Returns:
+        int or None: The buffer position just after the marker, or None if the
+        process ended or the timeout passed first.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        index = buffer.find(marker, position)
+        if index != -1:
+            return index + len(marker)
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0 or not selector.select(remaining):
+            return None
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:
+            return None
+        buffer += chunk
+
+def replay_session(session, data_dir, timeout=30, keep=False):
+    """
+    Replays a session script against a private copy of the data directory.
+
+    main.py runs in its own process inside a temporary directory holding a copy of
+    product_details.txt, so sessions can run side by side. Each operation is timed
+    from sending its inputs until the main menu prompt appears again. The stock
+    movements printed by the system are compared with the final product file.
+
+    Parameters:
+        session (list): A list of operations (see load_session).
+        data_dir (str): The directory containing the starting product_details.txt.
+        timeout (float): The maximum number of seconds to wait for one operation.
+        keep (bool): Keep the temporary directory even if the session passed its checks.
+
+    Returns:
+        dict: The session result with the keys:
+            - 'latencies' (dict): Operation names mapped to lists of seconds ('startup' included).
+            - 'invoices' (int): The number of invoice files written.
+            - 'errors' (list): Consistency and replay problems found (empty when all is well).
+            - 'workdir' (str): The temporary directory used.
+    """
+    workdir = tempfile.mkdtemp(prefix="wecare-sim-")
+    shutil.copy(os.path.join(data_dir, "product_details.txt"), workdir)
+    initial_products = load_products(workdir)
+
+    result = {"latencies": {}, "invoices": 0, "errors": [], "workdir": workdir}
+    marker = MENU_PROMPT.encode("utf-8")
+    environment = dict(os.environ)
+    environment["PYTHONIOENCODING"] = "utf-8"
+    buffer = bytearray()
+
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-u", MAIN_SCRIPT], cwd=workdir, env=environment,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    selector = selectors.DefaultSelector()
+    selector.register(process.stdout, selectors.EVENT_READ)
+    try:
+        position = read_until(process, selector, buffer, 0, marker, timeout)
+        if position is None:
+            result["errors"].append("main menu did not appear")
+        else:
+            result["latencies"]["startup"] = [time.perf_counter() - started]
+            for number, operation in enumerate(session, 1):
+                started = time.perf_counter()
+                process.stdin.write(("\n".join(operation["inputs"]) + "\n").encode("utf-8"))
+                process.stdin.flush()
+                position = read_until(process, selector, buffer, position, marker, timeout)
+                if position is None:
+                    result["errors"].append("operation " + str(number) + " (" + operation["op"] + \
+                                            ") did not return to the main menu")
+                    break
+                result["latencies"].setdefault(operation["op"], []).append(time.perf_counter() - started)
+        if position is not None:
+            process.stdin.write(b"4\n")
+            process.stdin.close()
+            while read_until(process, selector, buffer, len(buffer), b"\0", timeout) is not None:
+                pass
+            process.wait(timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        result["errors"].append("replay failed: " + str(e))
+    finally:
+        selector.close()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    check_session(buffer.decode("utf-8", "replace"), initial_products, workdir, result)
+    if not keep and not result["errors"]:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+def check_session(output, initial_products, workdir, result):
+    """
+    Checks that the final stock equals the initial stock plus restocks minus sold and free units.
+
+    The restocked, sold and free quantities are taken from the messages the system
+    prints for every item, and every announced invoice must exist as its own file.
+    Problems are added to result['errors'] and the invoice count to result['invoices'].
+
+    Parameters:
+        output (str): Everything the replayed session printed.
+        initial_products (dict): The products before the session (see read_products).
+        workdir (str): The directory the session ran in.
+        result (dict): The session result being built (see replay_session).
+    """
+    expected = {}
+    for details in initial_products.values():
+        expected[details["name"]] = expected.get(details["name"], 0) + details["quantity"]
+    for quantity, name in ADDED_LINE.findall(output):
+        expected[name] = expected.get(name, 0) + int(quantity)
+    for quantity, name, free in SOLD_LINE.findall(output):
+        expected[name] = expected.get(name, 0) - int(quantity) - int(free)
+
+    final = {}
+    for details in load_products(workdir).values():
+        final[details["name"]] = final.get(details["name"], 0) + details["quantity"]
+        if details["quantity"] < 0:
+            result["errors"].append("negative stock for " + details["name"])
+    for name in expected:
+        if final.get(name, 0) != expected[name]:
+            result["errors"].append("stock of " + name + " is " + str(final.get(name, 0)) + \
+                                    ", expected " + str(expected[name]))
+
+    announced = INVOICE_LINE.findall(output)
+    written = [name for name in os.listdir(workdir) if name.startswith(("PURCHASE-", "SALE-"))]
+    result["invoices"] = len(written)
+    if len(set(announced)) != len(announced) or len(written) != len(announced):
+        result["errors"].append(str(len(announced)) + " invoices announced but " + \
+                                str(len(written)) + " invoice files written")
+
+def percentile(values, fraction):
+    """
+    Returns the value at the given fraction of the sorted values (nearest rank).
+
+    Example:
+        >>> percentile([0.1, 0.2, 0.3, 0.4], 0.5)
+        0.2
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+def run_simulation(sessions, data_dir, concurrency, timeout=30, keep=False):
+    """
+    Replays sessions concurrently and prints latency, throughput and consistency results.
+
+    Parameters:
+        sessions (list): A list of sessions (see load_session).
+        data_dir (str): The directory containing the starting product_details.txt.
+        concurrency (int): The number of sessions replayed at the same time.
+        timeout (float): The maximum number of seconds to wait for one operation.
+        keep (bool): Keep the temporary directories of sessions that passed their checks.
+
+    Returns:
+        bool: True if every session passed the consistency checks.
+
+    Example:
+        $ python simulate.py run --synthetic 50 --operations 20 --concurrency 8
+        Simulation Results:
+        --------------------------------------------------------------------------------
+        Operation   Count     Mean (ms)   p50 (ms)    p95 (ms)    p99 (ms)    Max (ms)
+        --------------------------------------------------------------------------------
+        display     201       1.9         1.7         3.1         4.6         7.0
+        ...
+        Invoices written: 802 (61.4 per second)
+        Consistency: all 50 sessions passed
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda session: replay_session(session, data_dir, timeout, keep), sessions))
+    elapsed = time.perf_counter() - started
+
+    latencies = {}
+    invoices = 0
+    failed = []
+    for number, result in enumerate(results, 1):
+        for operation, values in result["latencies"].items():
+            latencies.setdefault(operation, []).extend(values)
+        invoices += result["invoices"]
+        if result["errors"]:
+            failed.append((number, result))
+
+    print("\nSimulation Results:")
+    print("-" * 80)
+    print("Sessions: " + str(len(sessions)) + " | Concurrency: " + str(concurrency) + \
+          " | Wall time: " + str(round(elapsed, 2)) + " s")
+    print("-" * 80)
+    print(pad_columns(["Operation", "Count", "Mean (ms)", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"]))
+    print("-" * 80)
+    for operation in ["startup", "display", "restock", "sell", "invalid"]:
+        values = latencies.get(operation)
+        if not values:
+            continue
+        row = [operation, str(len(values)), sum(values) / len(values), percentile(values, 0.5),
+               percentile(values, 0.95), percentile(values, 0.99), max(values)]
+        print(pad_columns([row[0], row[1]] + [str(round(value * 1000, 1)) for value in row[2:]]))
+    print("-" * 80)
+    print("Invoices written: " + str(invoices) + " (" + str(round(invoices / elapsed, 1)) + " per second)")
+    if failed:
+        print("Consistency: " + str(len(failed)) + " of " + str(len(sessions)) + " sessions failed")
+        for number, result in failed:
+            for error in result["errors"]:
+                print("  session " + str(number) + ": " + error + " [" + result["workdir"] + "]")
+    else:
+        print("Consistency: all " + str(len(sessions)) + " sessions passed")
+    print("-" * 80)
+    return not failed
+
+def pad_columns(values):
+    """
+    Joins table cells padded to a fixed column width (see pad_string).
+    """
+    from read import pad_string
+
+    return pad_string(values[0], 12) + "".join([pad_string(value, 12) for value in values[1:]])
+
+def main(argv=None):
+    """
+    Runs the simulator from the command line.
+
+    Commands:
+        record SCRIPT: run the interactive menu and save the session to SCRIPT.
+        generate SCRIPT: save a synthetic session to SCRIPT.
+        run [SCRIPT ...]: replay session scripts and/or synthetic sessions concurrently.
+
+    Parameters:
+        argv (list): The command line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        int: The exit status (0 on success, 1 if a session failed its checks).
+
+    Example:
+        $ python simulate.py record cashier.jsonl
+        $ python simulate.py run cashier.jsonl --repeat 100 --concurrency 16
+        $ python simulate.py run --synthetic 200 --operations 30 --seed 7
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="simulate.py",
+                                     description="Record, generate and replay WeCare cashier sessions.")
+    parser.add_argument("--data", default=".", help="directory with the starting product_details.txt (default: .)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record an interactive session")
+    record_parser.add_argument("script", help="the session script to write")
+
+    generate_parser = subparsers.add_parser("generate", help="write a synthetic session")
+    generate_parser.add_argument("script", help="the session script to write")
+    generate_parser.add_argument("--operations", type=int, default=20, help="menu operations (default: 20)")
+    generate_parser.add_argument("--seed", type=int, default=None, help="random seed")
+
+    run_parser = subparsers.add_parser("run", help="replay sessions concurrently")
+    run_parser.add_argument("scripts", nargs="*", help="session scripts to replay")
+    run_parser.add_argument("--repeat", type=int, default=1, help="replay each script this many times (default: 1)")
+    run_parser.add_argument("--synthetic", type=int, default=0, help="number of synthetic sessions to add")
+    run_parser.add_argument("--operations", type=int, default=20,
+                            help="menu operations per synthetic session (default: 20)")
+    run_parser.add_argument("--seed", type=int, default=None, help="random seed for synthetic sessions")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="sessions replayed at once (default: 8)")
+    run_parser.add_argument("--timeout", type=float, default=30, help="seconds to wait for one operation (default: 30)")
+    run_parser.add_argument("--keep", action="store_true", help="keep the directories of passing sessions too")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record_session(args.script)
+        return 0
+
+    products = load_products(args.data)
+    if not products:
+        print("Error: No products found in " + os.path.join(args.data, "product_details.txt"))
+        return 1
+    if args.command == "generate":
+        save_session(args.script, generate_session(products, args.operations, random.Random(args.seed)))
+        print("Synthetic session saved to: " + args.script)
+        return 0
+
+    sessions = []
+    for script in args.scripts:
+        sessions += [load_session(script)] * args.repeat
+    rng = random.Random(args.seed)
+    for count in range(args.synthetic):
+        sessions.append(generate_session(products, args.operations, rng))
+    if not sessions:
+        print("Nothing to replay. Give session scripts or --synthetic N.")
+        return 1
+    if run_simulation(sessions, args.data, max(1, args.concurrency), args.timeout, args.keep):
+        return 0
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
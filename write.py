@@ -1,6 +1,7 @@
 from datetime import datetime
 import random
 from read import pad_string
+from money import format_money
 
 def generate_bill_number(transaction_type):
     """
@@ -45,17 +46,17 @@ def save_products(products):
     Example:
         >>> products = {
               1: {'name': 'Vitamin C Serum', 'brand': 'Garnier', 'quantity': 10,
-                  'cost_price': 500.0, 'origin': 'France'}
+                  'cost_price': 50000, 'origin': 'France'}
                }
         >>> save_products(products)
         # Creates/updates 'product_details.txt' with:
-        # Vitamin C Serum,Garnier,10,500.0,France
+        # Vitamin C Serum,Garnier,10,500.00,France
     """
     try:
         with open("product_details.txt", "w") as file:
             for product_id, details in products.items():
                 file.write(details["name"] + "," + details["brand"] + "," + 
-                          str(details["quantity"]) + "," + str(details["cost_price"]) + 
+                          str(details["quantity"]) + "," + format_money(details["cost_price"]) + 
                           "," + details["origin"] + "\n")
     except Exception as e:
         print("Error saving product file: " + str(e))
@@ -69,9 +70,9 @@ def create_purchase_invoice(products_purchased, supplier_name, total_amount):
             - 'name' (str): Product name.
             - 'brand' (str): Product brand.
             - 'quantity' (int): Purchased quantity.
-            - 'cost_price' (float): Cost price per unit.
+            - 'cost_price' (int): Cost price per unit in paisa.
         supplier_name (str): The name of the supplier.
-        total_amount (float): The total cost of the purchase.
+        total_amount (int): The total cost of the purchase in paisa.
    
     Raises:
         Exception: If there is an error writing the invoice file.
@@ -79,9 +80,9 @@ def create_purchase_invoice(products_purchased, supplier_name, total_amount):
     Example:
         >>> products_purchased = [
              {'name': 'Vitamin C Serum', 'brand': 'Granier', 'quantity': 10,
-                'cost_price': 500.0}
+                'cost_price': 50000}
                 ]
-        >>> create_purchase_invoice(products_purchased, "Global Suppliers", 5000.0)
+        >>> create_purchase_invoice(products_purchased, "Global Suppliers", 500000)
         ================================================================================
                         PURCHASE INVOICE DISPLAY
         ================================================================================
@@ -94,9 +95,9 @@ def create_purchase_invoice(products_purchased, supplier_name, total_amount):
         --------------------------------------------------------------------------------
         Product              Brand           Qty        Unit Price     Total
         --------------------------------------------------------------------------------
-        Vitamin C Serum      Granier         10         500.0          5000.0
+        Vitamin C Serum      Granier         10         500.00         5000.00
         --------------------------------------------------------------------------------
-        Total Amount: NPR 5000.0
+        Total Amount: NPR 5000.00
         Purchase invoice saved to: PURCHASE-20250503123045-123.txt
     """
     
@@ -123,12 +124,12 @@ def create_purchase_invoice(products_purchased, supplier_name, total_amount):
         for product in products_purchased:
             line = pad_string(product["name"], 20) + pad_string(product["brand"], 15) + \
                    pad_string(str(product["quantity"]), 10) + \
-                   pad_string(str(product["cost_price"]), 15) + \
-                   pad_string(str(product["quantity"] * product["cost_price"]), 15)
+                   pad_string(format_money(product["cost_price"]), 15) + \
+                   pad_string(format_money(product["quantity"] * product["cost_price"]), 15)
             invoice_lines.append(line)
         
         invoice_lines.append("-" * 80)
-        invoice_lines.append("Total Amount: NPR " +  str(total_amount))
+        invoice_lines.append("Total Amount: NPR " +  format_money(total_amount))
         
         # Save to file
         with open(filename, "w") as file:
@@ -155,17 +156,17 @@ def create_sale_invoice(products_sold, customer_name, phone_number, total_amount
             - 'name' (str): Product name.
             - 'brand' (str): Product brand.
             - 'quantity' (int): Sold quantity.
-            - 'cost_price' (float): Cost price per unit.
+            - 'cost_price' (int): Cost price per unit in paisa.
             - 'free' (int): Number of free items (optional).
         customer_name (str): The name of the customer.
         phone_number (str): The customer's phone number.
-        total_amount (float): The total cost of sold items (before shipping).
+        total_amount (int): The total cost of sold items in paisa (before shipping).
         free_items (list): A list of dictionaries for free items, each containing:
             - 'name' (str): Product name.
             - 'brand' (str): Product brand.
             - 'quantity' (int): Free quantity.
-            - 'cost_price' (float): Cost price.
-        shipping_cost (float): The cost of shipping (0 if no shipping).
+            - 'cost_price' (int): Cost price in paisa.
+        shipping_cost (int): The cost of shipping in paisa (0 if no shipping).
    
     Raises:
         Exception: If there is an error writing the invoice file.
@@ -173,13 +174,13 @@ def create_sale_invoice(products_sold, customer_name, phone_number, total_amount
     Example:
         >>> products_sold = [
              {'name': 'Vitamin C Serum', 'brand': 'Grainer', 'quantity': 3,
-             'cost_price': 500.0, 'free': 1}
+             'cost_price': 50000, 'free': 1}
               ]
         >>> free_items = [
              {'name': 'Moisturizer', 'brand': 'Nivea', 'quantity': 1,
-          'cost_price': 500.0}
+          'cost_price': 50000}
          ]
-        >>> create_sale_invoice(products_sold, "Ram Prasad", "982332729", 3000.0, free_items, 500.0)
+        >>> create_sale_invoice(products_sold, "Ram Prasad", "982332729", 300000, free_items, 50000)
         ================================================================================
                         SALES INVOICE DISPLAY
         ================================================================================
@@ -195,13 +196,13 @@ def create_sale_invoice(products_sold, customer_name, phone_number, total_amount
         --------------------------------------------------------------------------------
         Product              Brand           Qty        Free       Unit Price     Total
         --------------------------------------------------------------------------------
-        Moisturizer          Granier           3          1          1000.0         3000.0
+        Moisturizer          Granier           3          1          1000.00        3000.00
         Free Items:
         Moisturizer (Granier) - 1 free
         --------------------------------------------------------------------------------
-        Subtotal Amount: NPR 3000.0
-        Shipping Cost: NPR 500.0
-        Total Amount: NPR 3500.0
+        Subtotal Amount: NPR 3000.00
+        Shipping Cost: NPR 500.00
+        Total Amount: NPR 3500.00
         Sales invoice saved to: SALE-20250503123045-123.txt
         
     """
@@ -235,8 +236,8 @@ def create_sale_invoice(products_sold, customer_name, phone_number, total_amount
             line = pad_string(product["name"], 20) + pad_string(product["brand"], 15) + \
                    pad_string(product["quantity"], 10) + \
                    pad_string(product.get("free", 0), 10) + \
-                   pad_string(str(selling_price), 15) + \
-                   pad_string(str(product["quantity"] * selling_price), 15)
+                   pad_string(format_money(selling_price), 15) + \
+                   pad_string(format_money(product["quantity"] * selling_price), 15)
             invoice_lines.append(line)
         
         if free_items:# only proceed when the free_items is non empty 
@@ -246,10 +247,10 @@ def create_sale_invoice(products_sold, customer_name, phone_number, total_amount
                                      str(item['quantity']) + " free")
         
         invoice_lines.append("-"*80)
-        invoice_lines.append("Subtotal Amount: NPR " + str(total_amount))
+        invoice_lines.append("Subtotal Amount: NPR " + format_money(total_amount))
         if shipping_cost > 0:
-            invoice_lines.append("Shipping Cost: NPR " + str(shipping_cost))
-        invoice_lines.append("Total Amount: NPR " + str(total_amount + shipping_cost))
+            invoice_lines.append("Shipping Cost: NPR " + format_money(shipping_cost))
+        invoice_lines.append("Total Amount: NPR " + format_money(total_amount + shipping_cost))
         
         
         # Save to file